@@ -0,0 +1,89 @@
+import os
+import sys
+import shutil
+import subprocess
+import importlib.util
+
+import pytest
+
+from venv_py.env_manager import EnvManager
+
+# virtualenv is optional; without it tests fall back to the stdlib venv module.
+_HAS_VIRTUALENV = importlib.util.find_spec("virtualenv") is not None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run slow integration tests",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=os.name != "nt")
+def reuse_fds(monkeypatch):
+    """Skips the O(max fds) close-fds loop for test venv subprocesses on POSIX."""
+    real_run = subprocess.run
+
+    def run_keeping_fds(*args, **kwargs):
+        command = args[0] if args else kwargs.get("args")
+        rendered = command if isinstance(command, str) else " ".join(map(str, command))
+        if ".test_venv" in rendered:
+            kwargs.setdefault("close_fds", False)
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", run_keeping_fds)
+
+
+@pytest.fixture(scope="session")
+def virtualenv_app_data(tmp_path_factory):
+    """Primes virtualenv's app-data cache once so later creations reuse it."""
+    app_data = tmp_path_factory.mktemp("virtualenv_app_data")
+    seed = str(tmp_path_factory.mktemp("virtualenv_seed") / "venv")
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "virtualenv",
+            "--seeder",
+            "app-data",
+            "--app-data",
+            str(app_data),
+            seed,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    shutil.rmtree(seed, ignore_errors=True)
+    return app_data
+
+
+@pytest.fixture(autouse=_HAS_VIRTUALENV)
+def fast_venv_create(monkeypatch, virtualenv_app_data):
+    """Creates test venvs with virtualenv's seeded cache instead of python -m venv."""
+
+    def _create(self, clear=False):
+        env = os.environ.copy()
+        env["VIRTUALENV_APP_DATA"] = str(virtualenv_app_data)
+        if sys.platform != "win32":
+            env["VIRTUALENV_SYMLINKS"] = "1"
+        cmd = [sys.executable, "-m", "virtualenv", "--seeder", "app-data"]
+        if clear:
+            cmd.append("--clear")
+        cmd.append(self.venv_path)
+        subprocess.run(cmd, check=True, capture_output=True, env=env)
+        self._log(f"Virtual environment created: {self.venv_path}")
+        self._exists_cache = True  # Same contract as the real _create
+        return True
+
+    monkeypatch.setattr(EnvManager, "_create", _create)